@@ -4,38 +4,142 @@ pods from a node in an EKS clusters in the event of an auto-scaling event or spo
 termination.
 """
 
+import base64
+import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import boto3
-import yaml
+import urllib3
 
-from kubernetes import client, config
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
 from botocore.exceptions import ClientError
+from urllib3.util.retry import Retry
+
+# Lambda attaches its own handler to the root logger, so just set the level
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Lambda reuses the container between invocations, so build the AWS clients
+# once and hang on to them.  Region specific clients and cluster details are
+# cached by region so that a warm container never mixes clusters up.
+_EC2 = boto3.client('ec2')
+_ASG = boto3.client('autoscaling')
+_REGIONAL_CLIENTS = {}
+_CLUSTER_CACHE = {}
+_TOKEN_CACHE = {}
+
+# EKS accepts a token for 15 minutes after it is signed.  The token is baked
+# into the kube config at the start of an invocation, so only reuse a cached
+# token if it will outlive an entire drain.
+_TOKEN_LIFETIME = 15 * 60
+_TOKEN_REFRESH_MARGIN = 5 * 60
+
+def _regional_client(service, region):
+    """
+    Returns a (cached) boto3 client for the given service and region.
 
-def generate_kube_config(region, cluster_name):
+    Parameters:
+    service (string): The AWS service to build a client for
+    region (string): The region the client should talk to
+    """
+
+    key = (service, region)
+    if key not in _REGIONAL_CLIENTS:
+        _REGIONAL_CLIENTS[key] = boto3.client(service, region_name=region)
+    return _REGIONAL_CLIENTS[key]
+
+def _describe_cluster(region, cluster_name):
+    """
+    Returns the EKS description of a cluster.  The endpoint and certificate
+    don't change for the life of a cluster, so this is only looked up once
+    per container.
+
+    Parameters:
+    region (string): The region the cluster is in
+    cluster_name (string): The name of the EKS cluster
+    """
+
+    key = (region, cluster_name)
+    if key not in _CLUSTER_CACHE:
+        eks = _regional_client('eks', region)
+        _CLUSTER_CACHE[key] = eks.describe_cluster(name=cluster_name)['cluster']
+    return _CLUSTER_CACHE[key]
+
+def _add_k8s_aws_id(params, context, **kwargs):
+    """
+    Moves the ClusterName parameter out of the GetCallerIdentity call and into
+    the request context so it can be added as a header.
+    """
+
+    if 'ClusterName' in params:
+        context['eks_cluster'] = params.pop('ClusterName')
+
+def _inject_k8s_aws_id_header(request, **kwargs):
+    """
+    Adds the x-k8s-aws-id header to the GetCallerIdentity request before it is
+    signed.  EKS uses this header to make sure the token was created for it.
     """
-    Creates a kubeconfig file in /tmp since Lambda's have read only filesystems.
 
-    In the future, we should build a config object instead of relying on
-    a file.
+    if 'eks_cluster' in request.context:
+        request.headers['x-k8s-aws-id'] = request.context['eks_cluster']
+
+def _eks_bearer_token(region, cluster_name):
+    """
+    Returns a bearer token for the cluster, built the same way
+    aws-iam-authenticator does it: a presigned STS GetCallerIdentity URL,
+    base64 encoded and prefixed with "k8s-aws-v1.".  Signing is done locally,
+    so there's no need to shell out to a binary for every K8S API call.
+
+    Parameters:
+    region (string): The region the cluster is in
+    cluster_name (string): The name of the EKS cluster
+    """
+
+    key = (region, cluster_name)
+    cached = _TOKEN_CACHE.get(key)
+    if cached and cached[1] - time.time() > _TOKEN_REFRESH_MARGIN:
+        return cached[0]
+
+    sts = _regional_client('sts', region)
+    sts.meta.events.register('provide-client-params.sts.GetCallerIdentity',
+                             _add_k8s_aws_id,
+                             unique_id='eks-node-drainer-k8s-aws-id')
+    sts.meta.events.register('before-sign.sts.GetCallerIdentity',
+                             _inject_k8s_aws_id_header,
+                             unique_id='eks-node-drainer-k8s-aws-id-header')
+
+    signed_at = time.time()
+    url = sts.generate_presigned_url('get_caller_identity',
+                                     Params={'ClusterName': cluster_name},
+                                     ExpiresIn=60,
+                                     HttpMethod='GET')
+    encoded_url = base64.urlsafe_b64encode(url.encode('utf-8')).decode('utf-8')
+    token = 'k8s-aws-v1.' + encoded_url.rstrip('=')
+
+    _TOKEN_CACHE[key] = (token, signed_at + _TOKEN_LIFETIME)
+    return token
+
+def generate_kube_config(region, cluster_name):
+    """
+    Builds a kubeconfig for the cluster.  The config is kept in memory and
+    loaded directly by the K8S client, so there's no need to write it out to
+    the filesystem.
 
     Parameters:
     region (string): The region that the lambda was invoked from
     cluster_name (string):  The name of the K8S cluster that the drain action
                             should be performed on.
-    """
-
-    config_file = "/tmp/kubeconfig"
 
-    # set up the client
-    eks_client = boto3.Session(region_name=region)
-    eks = eks_client.client("eks")
+    Returns:
+    cluster_config (dict): The kubeconfig for the cluster
+    """
 
     # get cluster details
-    cluster = eks.describe_cluster(name=cluster_name)
-    cluster_cert = cluster["cluster"]["certificateAuthority"]["data"]
-    cluster_ep = cluster["cluster"]["endpoint"]
+    cluster = _describe_cluster(region, cluster_name)
+    cluster_cert = cluster["certificateAuthority"]["data"]
+    cluster_ep = cluster["endpoint"]
 
     # build the cluster config hash
     cluster_config = {
@@ -65,21 +169,13 @@ def generate_kube_config(region, cluster_name):
             {
                 "name": str(cluster_name),
                 "user": {
-                    "exec": {
-                        "apiVersion": "client.authentication.k8s.io/v1alpha1",
-                        "command": "./aws-iam-authenticator",
-                        "args": [
-                            "token", "-i", str(cluster_name)
-                        ]
-                    }
+                    "token": _eks_bearer_token(region, cluster_name)
                 }
             }
         ]
     }
 
-    # Write out the yaml configuration file to /tmp since lambda is read-only
-    config_text = yaml.dump(cluster_config, default_flow_style=False)
-    open(config_file, "w").write(config_text)
+    return cluster_config
 
 def get_hostname(event):
     """
@@ -96,16 +192,14 @@ def get_hostname(event):
     event (object): The event that the lambda received from the CloudWatch hook
     """
 
-    ec2 = boto3.client('ec2')
-
     instance_id = event['detail']['EC2InstanceId']
 
     # if we fail to get the private DNS, go ahead and fail since we can't do much else
     try:
-        private_dns = ec2.describe_instances(InstanceIds=[instance_id]) \
+        private_dns = _EC2.describe_instances(InstanceIds=[instance_id]) \
                             ['Reservations'][0]['Instances'][0]['PrivateDnsName']
     except ClientError as e:
-        print("Exception when converting %s to private DNS: %s" % (instance_id, e))
+        logger.error("Exception when converting %s to private DNS: %s", instance_id, e)
         sys.exit(1)
 
     return private_dns
@@ -120,7 +214,7 @@ def cordon_node(api_instance, node):
 
     """
 
-    print("Cordoning Node " + node)
+    logger.info("Cordoning Node %s", node)
 
     # Doesn't look like there is a way to build the body object, so build it
     # manually
@@ -134,7 +228,7 @@ def cordon_node(api_instance, node):
     try:
         api_instance.patch_node(node, body)
     except ApiException as e:
-        print("Exception when cordoning %s: %s\n" % (node, e))
+        logger.error("Exception when cordoning %s: %s", node, e)
 
 def evict_pod(api_instance, name, namespace):
     """
@@ -150,7 +244,7 @@ def evict_pod(api_instance, name, namespace):
     namespace (string): The namespace the pod to evict is in
     """
 
-    print("Evicting " + name + " in namespace " + namespace + "!")
+    logger.info("Evicting %s in namespace %s!", name, namespace)
 
     delete_options = client.V1DeleteOptions()
     # After checking pod status for 12 minute, we'll assume the any remaining
@@ -160,17 +254,17 @@ def evict_pod(api_instance, name, namespace):
     delete_options.grace_period_seconds = 750
 
     metadata = client.V1ObjectMeta(name=name, namespace=namespace)
-    body = client.V1beta1Eviction(metadata=metadata,
-                                  api_version="policy/v1beta1",
-                                  kind="Eviction",
-                                  delete_options=delete_options)
+    body = client.V1Eviction(metadata=metadata,
+                             api_version="policy/v1",
+                             kind="Eviction",
+                             delete_options=delete_options)
 
     try:
         api_instance.create_namespaced_pod_eviction(name=name,
                                                     namespace=namespace,
                                                     body=body)
     except ApiException as e:
-        print("Exception when evicting %s: %s\n" % (name, e))
+        logger.error("Exception when evicting %s: %s", name, e)
 
 def continue_lifecycle(life_cycle_hook, auto_scaling_group, instance_id):
     """
@@ -181,43 +275,225 @@ def continue_lifecycle(life_cycle_hook, auto_scaling_group, instance_id):
     event (object): The event that the lamba object recieved
     """
 
-    asg = boto3.client('autoscaling')
-
     # We'll give this a shot, but if it fails, it will eventualy timeout and
     # continue, so don't halt the whole process
     try:
-        asg.complete_lifecycle_action(
+        _ASG.complete_lifecycle_action(
             LifecycleHookName=life_cycle_hook,
             AutoScalingGroupName=auto_scaling_group,
             LifecycleActionResult='CONTINUE',
             InstanceId=instance_id)
     except ClientError as e:
-        print("Exception in advancing lifecycle event %s: %s\n" % (life_cycle_hook, e))
+        logger.error("Exception in advancing lifecycle event %s: %s", life_cycle_hook, e)
 
-def get_evictable_pods(api_instance, node_name):
+def node_pod_selector(node_name):
+    """
+    Builds the field selector for the running pods on a node.  Pods that have
+    already finished are filtered out by the API server since there's nothing
+    to evict.
+
+    Parameters:
+    node_name (string): The name of the node
+
+    Returns:
+    field_selector (string): The field selector to list or watch pods with
+    """
+
+    return 'spec.nodeName=%s,status.phase!=Succeeded,status.phase!=Failed' % node_name
+
+def get_evictable_pods(api_instance, node_name, from_cache=True):
     """
     Get a list of all evictable pods currently on the supplied node.
-    This would not include pods which are controlled by a daemonset.
+    This would not include pods which are controlled by a daemonset, mirror
+    pods for static pods (which are owned by the node) or pods that have
+    already completed.
+
+    By default the list is requested with a resource version of "0" so that it
+    is served from the API server's watch cache rather than going all the way
+    to etcd.  The trade off is that the result may be slightly stale: pods the
+    cache hasn't caught up on yet are missing from it.  That's fine when polling
+    for pods to go away, since a stale list only delays noticing that they're
+    gone.  It is not fine when deciding what to evict, since any pod the cache
+    is missing would never be evicted, so pass from_cache=False for that.
 
     Parameters:
     api_instance (object): The K8S API object to use
     node_name (string): The name of the node to retrieve the pod list
+    from_cache (bool): Whether the list may be served from the watch cache
 
     Returns:
     pods_to_evict (list): List of pods that should be evicted from the node
 
     """
-    field_selector = 'spec.nodeName=' + node_name
+    field_selector = node_pod_selector(node_name)
 
-    pod_list = api_instance.list_pod_for_all_namespaces(watch=False, field_selector=field_selector)
     pods_to_evict = []
 
-    for pod in pod_list.items:
-        if pod.metadata.owner_references[0].kind != 'DaemonSet':
-            pods_to_evict.append(pod)
+    # Leaving out the resource version gets a consistent list from etcd
+    list_args = {'resource_version': '0'} if from_cache else {}
+    pod_list = api_instance.list_pod_for_all_namespaces(watch=False,
+                                                        field_selector=field_selector,
+                                                        limit=500,
+                                                        **list_args)
+    while True:
+        # Not every pod has an owner (bare pods), so don't assume there is one
+        pods_to_evict.extend(pod for pod in pod_list.items
+                             if not any(ref.kind in ('DaemonSet', 'Node')
+                                        for ref in (pod.metadata.owner_references or [])))
+
+        # The watch cache normally ignores the limit and returns everything in
+        # one go, but page through the rest if the API server didn't (or if we
+        # went to etcd)
+        if not pod_list.metadata._continue:
+            break
+        pod_list = api_instance.list_pod_for_all_namespaces(watch=False,
+                                                            field_selector=field_selector,
+                                                            limit=500,
+                                                            _continue=pod_list.metadata._continue)
 
     return pods_to_evict
 
+def watch_for_deletions(api_instance, field_selector, pending, resource_version, timeout):
+    """
+    Watch the pods matching the field selector, removing each pod from the
+    pending set as it is deleted.  Returns once every pending pod is gone or
+    the timeout is hit.
+
+    Parameters:
+    api_instance (object): The K8S API object to use
+    field_selector (string): The field selector for the pods to watch
+    pending (set): The (namespace, name) of each pod we're waiting on.  This
+                   is updated in place.
+    resource_version (string): The resource version to start watching from
+    timeout (int): The maximum number of seconds to wait
+
+    Returns:
+    resource_version (string): The last resource version seen, to resume from
+    """
+
+    endtime = time.time() + timeout
+    pod_watch = watch.Watch()
+
+    # The API server may close the watch before our timeout is up, so keep
+    # re-opening it from the last resource version we saw.  If our resource
+    # version has expired, the client raises an ApiException with a 410 status
+    # for the caller to handle.
+    while pending and time.time() < endtime:
+        logger.info("Waiting for %d pods to evict!", len(pending))
+        timeout_seconds = max(1, int(endtime - time.time()))
+        # The API server doesn't send anything while there are no changes, so
+        # give it a little longer than the watch timeout before giving up on a
+        # half-open connection
+        for event in pod_watch.stream(api_instance.list_pod_for_all_namespaces,
+                                      field_selector=field_selector,
+                                      resource_version=resource_version,
+                                      timeout_seconds=timeout_seconds,
+                                      _request_timeout=(10, timeout_seconds + 10)):
+            pod = event['object']
+            resource_version = pod.metadata.resource_version
+            if event['type'] == 'DELETED':
+                pending.discard((pod.metadata.namespace, pod.metadata.name))
+                if not pending:
+                    pod_watch.stop()
+                    break
+
+    return resource_version
+
+def poll_for_deletions(api_instance, node_name, pending, timeout):
+    """
+    Poll the node until every pending pod is gone or the timeout is hit.  This
+    is the fallback for when we can't watch the node.
+
+    Rather than re-listing at a fixed interval, the delay between lists starts
+    at 1 second and doubles (up to 10 seconds) for as long as no progress is
+    made.  It resets back to 1 second whenever a pod goes away.
+
+    Parameters:
+    api_instance (object): The K8S API object to use
+    node_name (string): The name of the node the pods are being evicted from
+    pending (set): The (namespace, name) of each pod we're waiting on.  This
+                   is updated in place.
+    timeout (int): The maximum number of seconds to wait
+    """
+
+    endtime = time.time() + timeout
+    delay = 1.0
+
+    while pending:
+        remaining = {(pod.metadata.namespace, pod.metadata.name)
+                     for pod in get_evictable_pods(api_instance=api_instance, node_name=node_name)}
+        if not remaining >= pending:
+            delay = 1.0
+        pending &= remaining
+
+        if not pending or time.time() >= endtime:
+            break
+        logger.info("Waiting for %d pods to evict!", len(pending))
+        time.sleep(min(delay, max(0, endtime - time.time())))
+        delay = min(delay * 2, 10.0)
+
+def wait_for_evictions(api_instance, node_name, pods, timeout, grace_period):
+    """
+    Wait for the supplied pods to be removed from the node.
+
+    Rather than re-listing the node's pods on an interval, this opens a watch
+    on the node and waits for a DELETED event for each pod.  The watch starts
+    from the resource version of a fresh list so that pods which were already
+    removed before the watch opened don't hold us up.
+
+    If pods are still around after the timeout, we keep watching for up to the
+    grace period to let the eviction ungracefully terminate them, but move on
+    as soon as they are gone.
+
+    If the watch fails for any reason (expired resource version, the role not
+    allowing watches, a dropped connection, etc.), we fall back to polling the
+    node for whatever time is left.
+
+    Parameters:
+    api_instance (object): The K8S API object to use
+    node_name (string): The name of the node the pods are being evicted from
+    pods (list): The pods that were evicted
+    timeout (int): The maximum number of seconds to wait for the pods to evict
+    grace_period (int): The maximum number of extra seconds to wait for any
+                        pods that are left after the timeout
+
+    Returns:
+    remaining_pods (list): List of pods still on the node when we stopped waiting
+
+    """
+    # Pods that finish rather than get deleted drop out of this selector, which
+    # the watch also reports as a DELETED event
+    field_selector = node_pod_selector(node_name)
+    endtime = time.time() + timeout + grace_period
+
+    pod_list = api_instance.list_pod_for_all_namespaces(watch=False, field_selector=field_selector)
+    resource_version = pod_list.metadata.resource_version
+    present = {(pod.metadata.namespace, pod.metadata.name) for pod in pod_list.items}
+    pending = {(pod.metadata.namespace, pod.metadata.name) for pod in pods} & present
+
+    try:
+        resource_version = watch_for_deletions(api_instance, field_selector, pending,
+                                               resource_version, timeout)
+        if pending:
+            # After we issue the evict to the pods, we give it 12 minutes to do so.  After
+            # which, the evict process will ungracefully terminate pods.  Let's give it up
+            # to 30 seconds to ungracefully evict, then continue on.
+            #
+            # This may not matter since the node is being terminated, but might as well
+            # let evict do it's thing
+            logger.info("Timed out waiting for pods to evict, waiting up to %d more seconds",
+                        grace_period)
+            watch_for_deletions(api_instance, field_selector, pending,
+                                resource_version, grace_period)
+    except (ApiException, urllib3.exceptions.HTTPError) as e:
+        # Long lived watches tend to die on connection errors (broken chunks,
+        # read timeouts, resets) rather than API errors, so catch both
+        logger.error("Exception when watching pods on %s, falling back to polling: %s",
+                     node_name, e)
+        poll_for_deletions(api_instance, node_name, pending, endtime - time.time())
+
+    return [pod for pod in pods if (pod.metadata.namespace, pod.metadata.name) in pending]
+
 def lambda_handler(event, context):
     """
     Coordinate the draining of the node specified by the scaling event.
@@ -225,9 +501,9 @@ def lambda_handler(event, context):
     This runs through the following flow:
 
     1.  Convert the instance ID to a hostname to be used by K8S
-    2.  Generate a kubeconfig file that can be loaded for K8S API calls
+    2.  Generate a kubeconfig that can be loaded for K8S API calls
     3.  Cordon the node
-    4.  Loop through every pod on the node, evicting individually
+    4.  Evict every pod on the node, in parallel
     5.  Wait for all pods to evict
     6.  Tell the lifecycle hook to continue on
 
@@ -241,57 +517,90 @@ def lambda_handler(event, context):
                       about the invocation, function, and execution environment
     """
 
-    # Convert the Instance ID to Hostname
-    node_name = get_hostname(event)
-
-    # Generate a kube config file from the information in the event
-    generate_kube_config(region=event['region'],
-                         cluster_name=event['detail']['NotificationMetadata'])
-
-    # Load the config file and init the client
-    config.load_kube_config("/tmp/kubeconfig")
-    api_instance = client.CoreV1Api()
-
-    # Cordon the node to be drained
-    print("Recieved a request to evict node " + node_name)
-    cordon_node(api_instance=api_instance, node=node_name)
+    # Converting the Instance ID to a hostname and generating the kube config
+    # are independent AWS calls, so run them at the same time
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        hostname_future = executor.submit(get_hostname, event)
+        kube_config_future = executor.submit(generate_kube_config,
+                                             region=event['region'],
+                                             cluster_name=event['detail']['NotificationMetadata'])
+        node_name = hostname_future.result()
+        cluster_config = kube_config_future.result()
+
+    # Load the config into our own configuration object rather than the
+    # client's global default, so nothing leaks between warm invocations
+    kube_config = client.Configuration()
+    config.load_kube_config_from_dict(cluster_config, client_configuration=kube_config)
+
+    # Evictions are issued in parallel, so make sure the connection pool is big
+    # enough for every worker to keep its connection (and TLS session) open
+    # rather than re-connecting for each call
+    kube_config.connection_pool_maxsize = 32
+
+    # Let urllib3 retry transient API server errors.  It only retries idempotent
+    # requests, so evictions (POST) are never sent twice.  Don't raise once the
+    # retries are used up so the response still surfaces as an ApiException.
+    kube_config.retries = Retry(total=3,
+                                backoff_factor=0.2,
+                                status_forcelist=[429, 500, 502, 503, 504],
+                                raise_on_status=False)
+
+    # A single ApiClient (and its urllib3 pool, which is thread safe) is built
+    # explicitly and shared by every helper and worker thread below
+    api_client = client.ApiClient(kube_config)
+    api_instance = client.CoreV1Api(api_client)
 
-    # Get a list of all the pods that are evictable (excludes pods managed by daemonset)
-    pods = get_evictable_pods(api_instance, node_name)
-
-    # loop through all pods and try to evict them from the node
-    for pod in pods:
-        evict_pod(api_instance=api_instance,
-                  name=pod.metadata.name,
-                  namespace=pod.metadata.namespace)
-
-    remaining_pods = []
-
-    # Max Lambda time is 15 minutes, let's wait for all pods to be evicted
-    # for 12 minutes to give ourselves a buffer
-    endtime = time.time() + 60 * 3
+    try:
+        # Cordon the node to be drained
+        logger.info("Recieved a request to evict node %s", node_name)
+        cordon_node(api_instance=api_instance, node=node_name)
+
+        # Get a list of all the pods that are evictable (excludes pods managed by
+        # daemonset).  This has to happen after the cordon so that nothing can be
+        # scheduled to the node after we've listed it, and it has to be a
+        # consistent list so that we don't miss anything the cache hasn't seen.
+        pods = get_evictable_pods(api_instance, node_name, from_cache=False)
+
+        # Nodes that only run daemonsets have nothing to evict, so don't bother
+        # waiting around
+        if not pods:
+            logger.info("No pods to evict.  Safe to proceed with node termination")
+            return
+
+        # Evict all pods in parallel.  Each eviction is a single round-trip to the
+        # API server, so overlap them rather than paying for them one at a time.
+        # Cap the workers so a busy node doesn't hammer the API server.
+        # evict_pod handles its own errors, so one failure won't stop the rest.
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [executor.submit(evict_pod,
+                                       api_instance=api_instance,
+                                       name=pod.metadata.name,
+                                       namespace=pod.metadata.namespace)
+                       for pod in pods]
+            for future in as_completed(futures):
+                future.result()
+
+        # Max Lambda time is 15 minutes, let's wait for all pods to be evicted
+        # for 12 minutes to give ourselves a buffer
+        remaining_pods = wait_for_evictions(api_instance=api_instance,
+                                            node_name=node_name,
+                                            pods=pods,
+                                            timeout=60 * 3,
+                                            grace_period=30)
 
-    while time.time() < endtime:
-        remaining_pods = get_evictable_pods(api_instance=api_instance, node_name=node_name)
         if not remaining_pods:
-            print("All pods have been evicted.  Safe to proceed with node termination")
-            break
-        print("Waiting for " + str(len(remaining_pods)) + " pods to evict!")
-        time.sleep(5)
-
-    if remaining_pods:
-        print("The following pods did not drain successfully:")
-        for pod in remaining_pods:
-            print(pod.metadata.namespace + "/" + pod.metadata.name)
-        # After we issue the evict to the pods, we give it 12 minutes to do so.  After which,
-        # the evict process will ungracefully terminate pods.  Let's give it 30 seconds to
-        # ungracefully evict, then continue on.
-        #
-        # This may not matter since the node is being terminated, but might as well
-        # let evict do it's thing
-        time.sleep(30)
-
-    # Tell the lifecycle hook to continue on
-    continue_lifecycle(life_cycle_hook=event['detail']['LifecycleHookName'],
-                       auto_scaling_group=event['detail']['AutoScalingGroupName'],
-                       instance_id=event['detail']['EC2InstanceId'])
+            logger.info("All pods have been evicted.  Safe to proceed with node termination")
+        else:
+            logger.warning("The following pods did not drain successfully:")
+            for pod in remaining_pods:
+                logger.warning("%s/%s", pod.metadata.namespace, pod.metadata.name)
+    finally:
+        # Shuts down the client's async_req thread pool, if one was started
+        api_client.close()
+
+        # Tell the lifecycle hook to continue on.  The node is going away
+        # regardless, so do this even if something went wrong mid-drain rather
+        # than leaving the hook to time out.
+        continue_lifecycle(life_cycle_hook=event['detail']['LifecycleHookName'],
+                           auto_scaling_group=event['detail']['AutoScalingGroupName'],
+                           instance_id=event['detail']['EC2InstanceId'])